@@ -28,23 +28,31 @@ from __future__ import annotations
 import importlib
 import logging
 import os
+import re
+import sys
+import threading
 import warnings
 from abc import ABC, abstractmethod
-from io import SEEK_SET
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from io import SEEK_SET, BufferedReader, RawIOBase
 from types import TracebackType
 from typing import (
+    Any,
     Dict,
+    Iterable,
     List,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     Type,
     Union,
-    runtime_checkable,
+    cast,
 )
 from urllib.parse import urlparse
 
-from pyiceberg.typedef import EMPTY_DICT, Properties
+from pyiceberg.typedef import EMPTY_DICT, FrozenDict, Properties
 
 logger = logging.getLogger(__name__)
 
@@ -86,63 +94,104 @@ GCS_DEFAULT_LOCATION = "gcs.default-bucket-location"
 GCS_VERSION_AWARE = "gcs.version-aware"
 PYARROW_USE_LARGE_TYPES_ON_READ = "pyarrow.use-large-types-on-read"
 
+IO_MAX_WORKERS = "io-max-workers"
+IO_MAX_WORKERS_DEFAULT = 64
+
+_IO_EXECUTOR: Optional[Executor] = None
+_IO_EXECUTOR_LOCK = threading.Lock()
+
+
+def _io_max_workers() -> int:
+    """Return the number of workers of the FileIO thread pool, from `io-max-workers` in the configuration.
+
+    The workers mostly wait on storage requests rather than use the CPU, so the default is well above
+    the CPU-based default of the ExecutorFactory pool, and doesn't follow its `max-workers`.
+    """
+    from pyiceberg.utils.config import Config
+
+    max_workers = Config().get_int(IO_MAX_WORKERS)
+    return max_workers if max_workers is not None else IO_MAX_WORKERS_DEFAULT
+
+
+def _io_executor() -> Executor:
+    """Return the thread pool that runs the concurrent storage requests of bulk FileIO operations.
+
+    This is deliberately not the pool of ExecutorFactory: scans and writes already run their tasks
+    there, and a task that blocks on work submitted to its own pool deadlocks once every worker is
+    waiting (always, with max-workers set to 1). The tasks submitted here are single storage requests
+    that never submit work themselves, so they can't deadlock this pool.
+    """
+    global _IO_EXECUTOR
+    with _IO_EXECUTOR_LOCK:
+        if _IO_EXECUTOR is None:
+            _IO_EXECUTOR = ThreadPoolExecutor(max_workers=_io_max_workers(), thread_name_prefix="pyiceberg-io")
+        return _IO_EXECUTOR
+
 
-@runtime_checkable
 class InputStream(Protocol):
     """A protocol for the file-like object returned by InputFile.open(...).
 
     This outlines the minimally required methods for a seekable input stream returned from an InputFile
     implementation's `open(...)` method. These methods are a subset of IOBase/RawIOBase.
+    This protocol is only used for static type checking and is not runtime checkable.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def read(self, size: int = 0) -> bytes: ...
 
-    @abstractmethod
     def seek(self, offset: int, whence: int = SEEK_SET) -> int: ...
 
-    @abstractmethod
     def tell(self) -> int: ...
 
-    @abstractmethod
     def close(self) -> None: ...
 
     def __enter__(self) -> InputStream:
         """Provide setup when opening an InputStream using a 'with' statement."""
 
-    @abstractmethod
     def __exit__(
         self, exctype: Optional[Type[BaseException]], excinst: Optional[BaseException], exctb: Optional[TracebackType]
     ) -> None:
         """Perform cleanup when exiting the scope of a 'with' statement."""
 
 
-@runtime_checkable
 class OutputStream(Protocol):  # pragma: no cover
     """A protocol for the file-like object returned by OutputFile.create(...).
 
     This outlines the minimally required methods for a writable output stream returned from an OutputFile
     implementation's `create(...)` method. These methods are a subset of IOBase/RawIOBase.
+    This protocol is only used for static type checking and is not runtime checkable.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def write(self, b: bytes) -> int: ...
 
-    @abstractmethod
     def close(self) -> None: ...
 
-    @abstractmethod
     def __enter__(self) -> OutputStream:
         """Provide setup when opening an OutputStream using a 'with' statement."""
 
-    @abstractmethod
     def __exit__(
         self, exctype: Optional[Type[BaseException]], excinst: Optional[BaseException], exctb: Optional[TracebackType]
     ) -> None:
         """Perform cleanup when exiting the scope of a 'with' statement."""
 
 
-class InputFile(ABC):
+class _FileBase(ABC):
+    """Shared storage for the location of InputFile and OutputFile implementations.
+
+    The location is kept in a slot, so file objects, of which a scan can create very many, don't carry
+    an instance `__dict__`. Subclasses have to declare `__slots__` as well to keep that saving.
+    """
+
+    __slots__ = ("_location",)
+
+    def __init__(self, location: str):
+        self._location = location
+
+
+class InputFile(_FileBase):
     """A base class for InputFile implementations.
 
     Args:
@@ -153,8 +202,7 @@ class InputFile(ABC):
         exists (bool): Whether the file exists or not.
     """
 
-    def __init__(self, location: str):
-        self._location = location
+    __slots__ = ()
 
     @abstractmethod
     def __len__(self) -> int:
@@ -174,11 +222,13 @@ class InputFile(ABC):
         """
 
     @abstractmethod
-    def open(self, seekable: bool = True) -> InputStream:
+    def open(self, seekable: bool = True, read_ahead: Optional[int] = None) -> InputStream:
         """Return an object that matches the InputStream protocol.
 
         Args:
             seekable: If the stream should support seek, or if it is consumed sequential.
+            read_ahead: A hint for the number of bytes to fetch per request when the file is read sequentially.
+                Implementations fall back to their own default when it is not set.
 
         Returns:
             InputStream: An object that matches the InputStream protocol.
@@ -188,8 +238,63 @@ class InputFile(ABC):
             FileNotFoundError: If the file at self.location does not exist.
         """
 
+    def open_buffered(self, buffer_size: int = 1024 * 1024) -> InputStream:
+        """Return a sequential InputStream that reads ahead in blocks of `buffer_size` bytes.
+
+        Reading from an object store is bound by request latency rather than throughput, so serving
+        many small reads from a single large read avoids a round-trip per read. Streams that already
+        buffer their reads (they expose `read1`) are returned as is, and so are streams that can't be
+        wrapped in a BufferedReader because they don't implement `readinto`.
+
+        Args:
+            buffer_size: The number of bytes to read ahead.
+
+        Returns:
+            InputStream: A non-seekable stream over the file, buffered unless it can't be wrapped.
+
+        Raises:
+            PermissionError: If the file at self.location cannot be accessed due to a permission error.
+            FileNotFoundError: If the file at self.location does not exist.
+        """
+        return _buffer_input_stream(self.open(seekable=False, read_ahead=buffer_size), buffer_size)
+
+    def read_ranges(self, offsets: Sequence[int], lengths: Sequence[int]) -> List[bytes]:
+        """Read several byte ranges of the file.
+
+        The default implementation seeks to each range of a single stream in turn. Implementations
+        backed by an object store should override this to fetch the ranges concurrently.
+
+        Args:
+            offsets: The start of each range, in bytes.
+            lengths: The number of bytes to read for each range.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the order of the given offsets.
+
+        Raises:
+            ValueError: If the number of offsets and lengths differ.
+            PermissionError: If the file at self.location cannot be accessed due to a permission error.
+            FileNotFoundError: If the file at self.location does not exist.
+        """
+        if len(offsets) != len(lengths):
+            raise ValueError(f"Expected as many offsets as lengths, got {len(offsets)} and {len(lengths)}")
+
+        ranges = []
+        with self.open() as input_stream:
+            for offset, length in zip(offsets, lengths):
+                input_stream.seek(offset)
+                ranges.append(input_stream.read(length))
+        return ranges
 
-class OutputFile(ABC):
+
+def _buffer_input_stream(input_stream: InputStream, buffer_size: int) -> InputStream:
+    """Wrap a stream in a BufferedReader, unless it already buffers its reads or can't be wrapped."""
+    if hasattr(input_stream, "read1") or not hasattr(input_stream, "readinto"):
+        return input_stream
+    return cast(InputStream, BufferedReader(cast(RawIOBase, input_stream), buffer_size=buffer_size))
+
+
+class OutputFile(_FileBase):
     """A base class for OutputFile implementations.
 
     Args:
@@ -200,8 +305,7 @@ class OutputFile(ABC):
         exists (bool): Whether the file exists or not.
     """
 
-    def __init__(self, location: str):
-        self._location = location
+    __slots__ = ()
 
     @abstractmethod
     def __len__(self) -> int:
@@ -242,12 +346,16 @@ class OutputFile(ABC):
 
 
 class FileIO(ABC):
-    """A base class for FileIO implementations."""
+    """A base class for FileIO implementations.
+
+    The properties are copied into a FrozenDict on construction, so implementations can derive
+    settings from them once instead of on every call.
+    """
 
     properties: Properties
 
     def __init__(self, properties: Properties = EMPTY_DICT):
-        self.properties = properties
+        self.properties = FrozenDict(properties)
 
     @abstractmethod
     def new_input(self, location: str) -> InputFile:
@@ -278,6 +386,41 @@ class FileIO(ABC):
             FileNotFoundError: When the file at the provided location does not exist.
         """
 
+    def new_inputs(self, locations: Iterable[str]) -> List[InputFile]:
+        """Get an InputFile instance for each of the given locations.
+
+        Args:
+            locations (Iterable[str]): URIs or paths to local files.
+        """
+        return [self.new_input(location) for location in locations]
+
+    def exists_many(self, locations: Iterable[str]) -> List[bool]:
+        """Check whether each of the given locations exists.
+
+        The checks are issued concurrently on the FileIO thread pool (see `_io_executor`), so the
+        wall-clock time is a few round-trips to the storage rather than one per location.
+
+        Args:
+            locations (Iterable[str]): URIs or paths to local files.
+
+        Returns:
+            List[bool]: Whether the file exists, in the order of the given locations.
+        """
+        return list(_io_executor().map(lambda input_file: input_file.exists(), self.new_inputs(locations)))
+
+    def delete_many(self, locations: Iterable[Union[str, InputFile, OutputFile]]) -> None:
+        """Delete the files at the given locations concurrently.
+
+        Args:
+            locations (Iterable[Union[str, InputFile, OutputFile]]): URIs or paths to local files, or InputFile
+                and OutputFile instances whose location attribute is used.
+
+        Raises:
+            PermissionError: If a file cannot be accessed due to a permission error.
+            FileNotFoundError: When a file at one of the provided locations does not exist.
+        """
+        list(_io_executor().map(self.delete, locations))
+
 
 LOCATION = "location"
 WAREHOUSE = "warehouse"
@@ -285,13 +428,23 @@ WAREHOUSE = "warehouse"
 ARROW_FILE_IO = "pyiceberg.io.pyarrow.PyArrowFileIO"
 FSSPEC_FILE_IO = "pyiceberg.io.fsspec.FsspecFileIO"
 
+PYARROW = "pyarrow"
+FSSPEC = "fsspec"
+
+# Short names accepted for py-io-impl, mapped to the fully qualified class name
+_PY_IO_ALIASES: Dict[str, str] = {
+    PYARROW: ARROW_FILE_IO,
+    FSSPEC: FSSPEC_FILE_IO,
+}
+
 # Mappings from the Java FileIO impl to a Python one. The list is ordered by preference.
 # If an implementation isn't installed, it will fall back to the next one.
 SCHEMA_TO_FILE_IO: Dict[str, List[str]] = {
     "s3": [ARROW_FILE_IO, FSSPEC_FILE_IO],
     "s3a": [ARROW_FILE_IO, FSSPEC_FILE_IO],
     "s3n": [ARROW_FILE_IO, FSSPEC_FILE_IO],
-    "gs": [ARROW_FILE_IO],
+    "gs": [ARROW_FILE_IO, FSSPEC_FILE_IO],
+    "gcs": [ARROW_FILE_IO, FSSPEC_FILE_IO],
     "file": [ARROW_FILE_IO, FSSPEC_FILE_IO],
     "hdfs": [ARROW_FILE_IO],
     "viewfs": [ARROW_FILE_IO],
@@ -300,15 +453,24 @@ SCHEMA_TO_FILE_IO: Dict[str, List[str]] = {
 }
 
 
-def _import_file_io(io_impl: str, properties: Properties) -> Optional[FileIO]:
+@lru_cache(maxsize=32)
+def _resolve_file_io_class(io_impl: str) -> Type[FileIO]:
+    """Import and return the FileIO class for a fully qualified name.
+
+    The lookup is memoized, so the module import and attribute resolution only happen once per
+    implementation. Failed imports raise and are therefore not cached.
+    """
+    path_parts = io_impl.split(".")
+    if len(path_parts) < 2:
+        raise ValueError(f"py-io-impl should be full path (module.CustomFileIO), got: {io_impl}")
+    module_name, class_name = ".".join(path_parts[:-1]), path_parts[-1]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def _import_file_io_class(io_impl: str) -> Optional[Type[FileIO]]:
     try:
-        path_parts = io_impl.split(".")
-        if len(path_parts) < 2:
-            raise ValueError(f"py-io-impl should be full path (module.CustomFileIO), got: {io_impl}")
-        module_name, class_name = ".".join(path_parts[:-1]), path_parts[-1]
-        module = importlib.import_module(module_name)
-        class_ = getattr(module, class_name)
-        return class_(properties)
+        return _resolve_file_io_class(_PY_IO_ALIASES.get(io_impl, io_impl))
     except ModuleNotFoundError:
         logger.warning("Could not initialize FileIO: %s", io_impl)
         return None
@@ -317,55 +479,143 @@ def _import_file_io(io_impl: str, properties: Properties) -> Optional[FileIO]:
 PY_IO_IMPL = "py-io-impl"
 
 
-def _infer_file_io_from_scheme(path: str, properties: Properties) -> Optional[FileIO]:
-    parsed_url = urlparse(path)
-    if parsed_url.scheme:
-        if file_ios := SCHEMA_TO_FILE_IO.get(parsed_url.scheme):
-            for file_io_path in file_ios:
-                if file_io := _import_file_io(file_io_path, properties):
-                    return file_io
-        else:
-            warnings.warn(f"No preferred file implementation for scheme: {parsed_url.scheme}")
+@lru_cache(maxsize=64)
+def _infer_file_io_class(scheme: str, file_ios: Optional[Tuple[str, ...]]) -> Optional[Type[FileIO]]:
+    """Return the first FileIO class in the preference list of the scheme that can be imported.
+
+    The outcome is memoized per scheme and preference list, including a negative one, so implementations
+    that are not installed are only tried, and an unknown scheme is only warned about, once. Since the
+    preference list is part of the key, changes to SCHEMA_TO_FILE_IO after a lookup still take effect.
+    """
+    if file_ios:
+        for file_io_path in file_ios:
+            try:
+                return _resolve_file_io_class(file_io_path)
+            except ModuleNotFoundError:
+                logger.warning("Could not initialize FileIO: %s", file_io_path)
+    else:
+        warnings.warn(f"No preferred file implementation for scheme: {scheme}")
     return None
 
 
-def load_file_io(properties: Properties = EMPTY_DICT, location: Optional[str] = None) -> FileIO:
+def _infer_file_io_class_from_scheme(path: str) -> Optional[Type[FileIO]]:
+    scheme, _, _ = _split_location(path)
+    if scheme:
+        file_ios = SCHEMA_TO_FILE_IO.get(scheme)
+        return _infer_file_io_class(scheme, tuple(file_ios) if file_ios else None)
+    return None
+
+
+def _load_file_io_class(properties: Properties, location: Optional[str]) -> Type[FileIO]:
     # First look for the py-io-impl property to directly load the class
     if io_impl := properties.get(PY_IO_IMPL):
-        if file_io := _import_file_io(io_impl, properties):
+        if file_io_class := _import_file_io_class(io_impl):
             logger.info("Loaded FileIO: %s", io_impl)
-            return file_io
+            return file_io_class
         else:
             raise ValueError(f"Could not initialize FileIO: {io_impl}")
 
     # Check the table location
     if location:
-        if file_io := _infer_file_io_from_scheme(location, properties):
-            return file_io
+        if file_io_class := _infer_file_io_class_from_scheme(location):
+            return file_io_class
 
     # Look at the schema of the warehouse
     if warehouse_location := properties.get(WAREHOUSE):
-        if file_io := _infer_file_io_from_scheme(warehouse_location, properties):
-            return file_io
+        if file_io_class := _infer_file_io_class_from_scheme(warehouse_location):
+            return file_io_class
 
     try:
         # Default to PyArrow
         logger.info("Defaulting to PyArrow FileIO")
-        from pyiceberg.io.pyarrow import PyArrowFileIO
-
-        return PyArrowFileIO(properties)
+        return _resolve_file_io_class(ARROW_FILE_IO)
     except ModuleNotFoundError as e:
         raise ModuleNotFoundError(
             'Could not load a FileIO, please consider installing one: pip3 install "pyiceberg[pyarrow]", for more options refer to the docs.'
         ) from e
 
 
+@lru_cache(maxsize=16)
+def _build_file_io(file_io_class: Type[FileIO], properties_key: Tuple[Tuple[str, Any], ...]) -> FileIO:
+    """Construct a FileIO, memoized so that the same configuration shares one instance and its filesystems."""
+    return file_io_class(dict(properties_key))
+
+
+def clear_file_io_cache() -> None:
+    """Drop the FileIOs that load_file_io has cached, so that the next call constructs a new instance."""
+    _build_file_io.cache_clear()
+
+
+def load_file_io(properties: Properties = EMPTY_DICT, location: Optional[str] = None) -> FileIO:
+    """Load a FileIO for the given properties and location.
+
+    FileIOs are cached per process: callers that pass equal properties and resolve to the same
+    implementation get the same instance, along with the filesystems it has initialized. Up to 16
+    instances are kept alive; use clear_file_io_cache to release them.
+
+    Args:
+        properties (Properties): The properties to configure the FileIO with.
+        location (Optional[str]): A location used to infer the FileIO implementation when none is configured.
+
+    Returns:
+        FileIO: A FileIO for the given configuration.
+    """
+    file_io_class = _load_file_io_class(properties, location)
+
+    # Initializing a filesystem can take a network round-trip, so FileIOs are shared between
+    # callers with the same configuration. Their properties are a FrozenDict that rejects every
+    # mutation, so one caller can't change the configuration another one receives.
+    properties_key = tuple(sorted(properties.items()))
+    try:
+        hash(properties_key)
+    except TypeError:
+        # Unhashable property values can't be used as a cache key
+        return file_io_class(properties)
+    return _build_file_io(file_io_class, properties_key)
+
+
+# urlparse removes these characters from anywhere in the URL, so leave such locations to it
+_URLPARSE_REMOVED_CHARS = re.compile("[\t\r\n]")
+
+
+@lru_cache(maxsize=4096)
+def _split_location(location: str) -> Tuple[str, str, str]:
+    """Split a location into scheme, netloc and path, with the same result as `urlparse`.
+
+    Plain `scheme://netloc/path` URIs and local paths are split with string operations, which is
+    considerably cheaper than `urlparse`. Anything else (queries, fragments, uncommon schemes,
+    tabs and newlines) falls back to `urlparse`. The scheme is empty when the location does not have one.
+    """
+    if not _URLPARSE_REMOVED_CHARS.search(location):
+        scheme, sep, rest = location.partition("://")
+        if sep:
+            if scheme.isascii() and scheme.isalnum() and scheme[0].isalpha() and "?" not in rest and "#" not in rest:
+                netloc, slash, path = rest.partition("/")
+                return sys.intern(scheme.lower()), netloc, slash + path
+        elif ":" not in location and not location.startswith("//"):
+            return "", "", location
+
+    uri = urlparse(location)
+    return sys.intern(uri.scheme), uri.netloc, uri.path
+
+
+# Matches paths that os.path.normpath would change: "." and ".." segments, repeated or trailing separators
+_NON_NORMALIZED_PATH = re.compile(r"//|/\.\.?(?=/|$)|/$")
+
+
+def _abspath(path: str) -> str:
+    """Return the absolute path, skipping os.path.abspath for POSIX paths that are already absolute and normalized."""
+    if os.sep == "/" and path.startswith("/") and not _NON_NORMALIZED_PATH.search(path):
+        return path
+    return os.path.abspath(path)
+
+
 def _parse_location(location: str) -> Tuple[str, str, str]:
     """Return the path without the scheme."""
-    uri = urlparse(location)
-    if not uri.scheme:
-        return "file", uri.netloc, os.path.abspath(location)
-    elif uri.scheme in ("hdfs", "viewfs"):
-        return uri.scheme, uri.netloc, uri.path
+    scheme, netloc, path = _split_location(location)
+    if not scheme:
+        return "file", netloc, _abspath(location)
+    elif scheme in ("hdfs", "viewfs"):
+        return scheme, netloc, path
     else:
-        return uri.scheme, uri.netloc, f"{uri.netloc}{uri.path}"
+        return scheme, netloc, f"{netloc}{path}"
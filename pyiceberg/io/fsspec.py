@@ -21,20 +21,23 @@ import json
 import logging
 import os
 from copy import copy
-from functools import lru_cache, partial
+from functools import partial
 from typing import (
     Any,
     Callable,
     Dict,
+    List,
+    Optional,
+    Sequence,
     Union,
 )
-from urllib.parse import urlparse
 
 import requests
 from botocore import UNSIGNED
 from botocore.awsrequest import AWSRequest
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
+from fsspec.spec import AbstractBufferedFile
 from requests import HTTPError
 
 from pyiceberg.catalog import TOKEN
@@ -76,6 +79,8 @@ from pyiceberg.io import (
     InputStream,
     OutputFile,
     OutputStream,
+    _buffer_input_stream,
+    _split_location,
 )
 from pyiceberg.typedef import Properties
 from pyiceberg.utils.properties import get_first_property_value, property_as_bool
@@ -211,6 +216,8 @@ class FsspecInputFile(InputFile):
         fs (AbstractFileSystem): An fsspec filesystem instance.
     """
 
+    __slots__ = ("_fs",)
+
     def __init__(self, location: str, fs: AbstractFileSystem):
         self._fs = fs
         super().__init__(location=location)
@@ -228,11 +235,12 @@ class FsspecInputFile(InputFile):
         """Check whether the location exists."""
         return self._fs.lexists(self.location)
 
-    def open(self, seekable: bool = True) -> InputStream:
+    def open(self, seekable: bool = True, read_ahead: Optional[int] = None) -> InputStream:
         """Create an input stream for reading the contents of the file.
 
         Args:
             seekable: If the stream should support seek, or if it is consumed sequential.
+            read_ahead: The block size used to read the file, defaults to the block size of the filesystem.
 
         Returns:
             OpenFile: An fsspec compliant file-like object.
@@ -241,11 +249,55 @@ class FsspecInputFile(InputFile):
             FileNotFoundError: If the file does not exist.
         """
         try:
+            if read_ahead is not None:
+                return self._fs.open(self.location, "rb", block_size=read_ahead)
             return self._fs.open(self.location, "rb")
         except FileNotFoundError as e:
             # To have a consistent error handling experience, make sure exception contains missing file location.
             raise e if e.filename else FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), self.location) from e
 
+    def open_buffered(self, buffer_size: int = 1024 * 1024) -> InputStream:
+        """Return a sequential InputStream that reads ahead in blocks of `buffer_size` bytes.
+
+        Object store files, such as those of s3fs, are an AbstractBufferedFile that already reads ahead
+        in blocks of `buffer_size`, so they are returned as is rather than buffered a second time.
+
+        Args:
+            buffer_size: The number of bytes to read ahead.
+
+        Returns:
+            InputStream: A non-seekable stream over the file, buffered unless it can't be wrapped.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        input_stream = self.open(seekable=False, read_ahead=buffer_size)
+        if isinstance(input_stream, AbstractBufferedFile):
+            return input_stream
+        return _buffer_input_stream(input_stream, buffer_size)
+
+    def read_ranges(self, offsets: Sequence[int], lengths: Sequence[int]) -> List[bytes]:
+        """Read several byte ranges of the file using the `cat_ranges` of the filesystem.
+
+        Asynchronous filesystems, such as s3fs, fetch the ranges concurrently.
+
+        Args:
+            offsets: The start of each range, in bytes.
+            lengths: The number of bytes to read for each range.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the order of the given offsets.
+        """
+        if len(offsets) != len(lengths):
+            raise ValueError(f"Expected as many offsets as lengths, got {len(offsets)} and {len(lengths)}")
+
+        ends = [offset + length for offset, length in zip(offsets, lengths)]
+        ranges = self._fs.cat_ranges([self.location] * len(offsets), list(offsets), ends)
+        for result in ranges:
+            if isinstance(result, Exception):
+                raise result
+        return ranges
+
 
 class FsspecOutputFile(OutputFile):
     """An output file implementation for the FsspecFileIO.
@@ -255,6 +307,8 @@ class FsspecOutputFile(OutputFile):
         fs (AbstractFileSystem): An fsspec filesystem instance.
     """
 
+    __slots__ = ("_fs",)
+
     def __init__(self, location: str, fs: AbstractFileSystem):
         self._fs = fs
         super().__init__(location=location)
@@ -302,10 +356,12 @@ class FsspecOutputFile(OutputFile):
 class FsspecFileIO(FileIO):
     """A FileIO implementation that uses fsspec."""
 
+    _fs_cache: Dict[str, AbstractFileSystem]
+
     def __init__(self, properties: Properties):
         self._scheme_to_fs = {}
         self._scheme_to_fs.update(SCHEME_TO_FS)
-        self.get_fs: Callable[[str], AbstractFileSystem] = lru_cache(self._get_fs)
+        self._fs_cache = {}
         super().__init__(properties=properties)
 
     def new_input(self, location: str) -> FsspecInputFile:
@@ -317,8 +373,8 @@ class FsspecFileIO(FileIO):
         Returns:
             FsspecInputFile: An FsspecInputFile instance for the given location.
         """
-        uri = urlparse(location)
-        fs = self.get_fs(uri.scheme)
+        scheme, _, _ = _split_location(location)
+        fs = self.get_fs(scheme)
         return FsspecInputFile(location=location, fs=fs)
 
     def new_output(self, location: str) -> FsspecOutputFile:
@@ -330,8 +386,8 @@ class FsspecFileIO(FileIO):
         Returns:
             FsspecOutputFile: An FsspecOutputFile instance for the given location.
         """
-        uri = urlparse(location)
-        fs = self.get_fs(uri.scheme)
+        scheme, _, _ = _split_location(location)
+        fs = self.get_fs(scheme)
         return FsspecOutputFile(location=location, fs=fs)
 
     def delete(self, location: Union[str, InputFile, OutputFile]) -> None:
@@ -342,15 +398,21 @@ class FsspecFileIO(FileIO):
                 OutputFile instance is provided, the location attribute for that instance is used as the location
                 to delete.
         """
-        if isinstance(location, (InputFile, OutputFile)):
-            str_location = location.location  # Use InputFile or OutputFile location
-        else:
+        if isinstance(location, str):
             str_location = location
+        else:
+            str_location = location.location  # Use InputFile or OutputFile location
 
-        uri = urlparse(str_location)
-        fs = self.get_fs(uri.scheme)
+        scheme, _, _ = _split_location(str_location)
+        fs = self.get_fs(scheme)
         fs.rm(str_location)
 
+    def get_fs(self, scheme: str) -> AbstractFileSystem:
+        """Get a filesystem for a specific scheme, initializing it on first use."""
+        if (fs := self._fs_cache.get(scheme)) is None:
+            fs = self._fs_cache[scheme] = self._get_fs(scheme)
+        return fs
+
     def _get_fs(self, scheme: str) -> AbstractFileSystem:
         """Get a filesystem for a specific scheme."""
         if scheme not in self._scheme_to_fs:
@@ -360,10 +422,9 @@ class FsspecFileIO(FileIO):
     def __getstate__(self) -> Dict[str, Any]:
         """Create a dictionary of the FsSpecFileIO fields used when pickling."""
         fileio_copy = copy(self.__dict__)
-        fileio_copy["get_fs"] = None
+        fileio_copy["_fs_cache"] = {}
         return fileio_copy
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         """Deserialize the state into a FsSpecFileIO instance."""
         self.__dict__ = state
-        self.get_fs = lru_cache(self._get_fs)
@@ -49,6 +49,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
@@ -109,6 +110,7 @@ from pyiceberg.io import (
     InputStream,
     OutputFile,
     OutputStream,
+    _io_executor,
     _parse_location,
 )
 from pyiceberg.manifest import (
@@ -214,6 +216,8 @@ class PyArrowFile(InputFile, OutputFile):
         >>> # output_file.create().write(b'foobytes')
     """
 
+    __slots__ = ("_filesystem", "_path", "_buffer_size")
+
     _filesystem: FileSystem
     _path: str
     _buffer_size: int
@@ -255,11 +259,12 @@ class PyArrowFile(InputFile, OutputFile):
         except FileNotFoundError:
             return False
 
-    def open(self, seekable: bool = True) -> InputStream:
+    def open(self, seekable: bool = True, read_ahead: Optional[int] = None) -> InputStream:
         """Open the location using a PyArrow FileSystem inferred from the location.
 
         Args:
             seekable: If the stream should support seek, or if it is consumed sequential.
+            read_ahead: The buffer size of a sequential stream, defaults to the buffer size of the file.
 
         Returns:
             pyarrow.lib.NativeFile: A NativeFile instance for the file located at `self.location`.
@@ -273,7 +278,8 @@ class PyArrowFile(InputFile, OutputFile):
             if seekable:
                 input_file = self._filesystem.open_input_file(self._path)
             else:
-                input_file = self._filesystem.open_input_stream(self._path, buffer_size=self._buffer_size)
+                buffer_size = read_ahead if read_ahead is not None else self._buffer_size
+                input_file = self._filesystem.open_input_stream(self._path, buffer_size=buffer_size)
         except FileNotFoundError:
             raise
         except PermissionError:
@@ -286,6 +292,27 @@ class PyArrowFile(InputFile, OutputFile):
             raise  # pragma: no cover - If some other kind of OSError, raise the raw error
         return input_file
 
+    def read_ranges(self, offsets: Sequence[int], lengths: Sequence[int]) -> List[bytes]:
+        """Read several byte ranges of the file concurrently.
+
+        The file is opened once for random access, and each range is read with a positional read on the
+        FileIO thread pool, so the requests for the ranges are in flight at the same time. That pool is
+        separate from the ExecutorFactory one, so this can be called from scan tasks without deadlocking.
+
+        Args:
+            offsets: The start of each range, in bytes.
+            lengths: The number of bytes to read for each range.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the order of the given offsets.
+        """
+        if len(offsets) != len(lengths):
+            raise ValueError(f"Expected as many offsets as lengths, got {len(offsets)} and {len(lengths)}")
+
+        # A seekable stream from open() is a pyarrow.NativeFile, which supports positional reads
+        with cast(pyarrow.NativeFile, self.open(seekable=True)) as input_file:
+            return list(_io_executor().map(input_file.read_at, lengths, offsets))
+
     def create(self, overwrite: bool = False) -> OutputStream:
         """Create a writable pyarrow.lib.NativeFile for this PyArrowFile's location.
 
@@ -328,22 +355,25 @@ class PyArrowFile(InputFile, OutputFile):
 
 
 class PyArrowFileIO(FileIO):
-    fs_by_scheme: Callable[[str, Optional[str]], FileSystem]
+    _fs_cache: Dict[Tuple[str, Optional[str]], FileSystem]
+    _buffer_size: int
 
     def __init__(self, properties: Properties = EMPTY_DICT):
-        self.fs_by_scheme: Callable[[str, Optional[str]], FileSystem] = lru_cache(self._initialize_fs)
+        self._fs_cache = {}
         super().__init__(properties=properties)
+        self._buffer_size = int(self.properties.get(BUFFER_SIZE, ONE_MEGABYTE))
 
     @staticmethod
     def parse_location(location: str) -> Tuple[str, str, str]:
         """Return the path without the scheme."""
-        uri = urlparse(location)
-        if not uri.scheme:
-            return "file", uri.netloc, os.path.abspath(location)
-        elif uri.scheme in ("hdfs", "viewfs"):
-            return uri.scheme, uri.netloc, uri.path
-        else:
-            return uri.scheme, uri.netloc, f"{uri.netloc}{uri.path}"
+        return _parse_location(location)
+
+    def fs_by_scheme(self, scheme: str, netloc: Optional[str] = None) -> FileSystem:
+        """Return the filesystem for a scheme and netloc, initializing it on first use."""
+        key = (scheme, netloc)
+        if (fs := self._fs_cache.get(key)) is None:
+            fs = self._fs_cache[key] = self._initialize_fs(scheme, netloc)
+        return fs
 
     def _initialize_fs(self, scheme: str, netloc: Optional[str] = None) -> FileSystem:
         if scheme in {"s3", "s3a", "s3n"}:
@@ -416,7 +446,7 @@ class PyArrowFileIO(FileIO):
             fs=self.fs_by_scheme(scheme, netloc),
             location=location,
             path=path,
-            buffer_size=int(self.properties.get(BUFFER_SIZE, ONE_MEGABYTE)),
+            buffer_size=self._buffer_size,
         )
 
     def new_output(self, location: str) -> PyArrowFile:
@@ -433,7 +463,7 @@ class PyArrowFileIO(FileIO):
             fs=self.fs_by_scheme(scheme, netloc),
             location=location,
             path=path,
-            buffer_size=int(self.properties.get(BUFFER_SIZE, ONE_MEGABYTE)),
+            buffer_size=self._buffer_size,
         )
 
     def delete(self, location: Union[str, InputFile, OutputFile]) -> None:
@@ -448,7 +478,7 @@ class PyArrowFileIO(FileIO):
             PermissionError: If the file at the provided location cannot be accessed due to a permission error such as
                 an AWS error code 15.
         """
-        str_location = location.location if isinstance(location, (InputFile, OutputFile)) else location
+        str_location = location if isinstance(location, str) else location.location
         scheme, netloc, path = self.parse_location(str_location)
         fs = self.fs_by_scheme(scheme, netloc)
 
@@ -468,13 +498,12 @@ class PyArrowFileIO(FileIO):
     def __getstate__(self) -> Dict[str, Any]:
         """Create a dictionary of the PyArrowFileIO fields used when pickling."""
         fileio_copy = copy(self.__dict__)
-        fileio_copy["fs_by_scheme"] = None
+        fileio_copy["_fs_cache"] = {}
         return fileio_copy
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         """Deserialize the state into a PyArrowFileIO instance."""
         self.__dict__ = state
-        self.fs_by_scheme = lru_cache(self._initialize_fs)
 
 
 def schema_to_pyarrow(
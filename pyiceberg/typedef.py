@@ -48,9 +48,33 @@ class FrozenDict(Dict[Any, Any]):
         """Assign a value to a FrozenDict."""
         raise AttributeError("FrozenDict does not support assignment")
 
+    def __delitem__(self, instance: Any) -> None:
+        """Delete a key from a FrozenDict."""
+        raise AttributeError("FrozenDict does not support deletion")
+
+    def __ior__(self, other: Any) -> "FrozenDict":  # type: ignore[misc]
+        """Merge a mapping into a FrozenDict in place."""
+        raise AttributeError("FrozenDict does not support |=")
+
     def update(self, *args: Any, **kwargs: Any) -> None:
         raise AttributeError("FrozenDict does not support .update()")
 
+    def pop(self, *args: Any, **kwargs: Any) -> Any:
+        raise AttributeError("FrozenDict does not support .pop()")
+
+    def popitem(self) -> Tuple[Any, Any]:
+        raise AttributeError("FrozenDict does not support .popitem()")
+
+    def setdefault(self, *args: Any, **kwargs: Any) -> Any:
+        raise AttributeError("FrozenDict does not support .setdefault()")
+
+    def clear(self) -> None:
+        raise AttributeError("FrozenDict does not support .clear()")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle by passing the items to the constructor, since they cannot be assigned afterwards."""
+        return self.__class__, (dict(self),)
+
 
 UTF8 = "utf-8"
 
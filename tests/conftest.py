@@ -57,6 +57,7 @@ from pyiceberg.io import (
     GCS_PROJECT_ID,
     GCS_TOKEN,
     GCS_TOKEN_EXPIRES_AT_MS,
+    clear_file_io_cache,
     fsspec,
     load_file_io,
 )
@@ -138,6 +139,14 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption("--gcs.project-id", action="store", default="test", help="The GCP project for tests marked gcs")
 
 
+@pytest.fixture(autouse=True)
+def _clear_file_io_cache() -> Generator[None, None, None]:
+    # load_file_io shares FileIOs between callers, so don't let one test hand its (possibly patched) filesystems to the next
+    clear_file_io_cache()
+    yield
+    clear_file_io_cache()
+
+
 @pytest.fixture(scope="session")
 def table_schema_simple() -> Schema:
     return schema.Schema(
@@ -40,7 +40,7 @@ from pyiceberg.expressions import (
     NotEqualTo,
     NotNaN,
 )
-from pyiceberg.io import PYARROW_USE_LARGE_TYPES_ON_READ
+from pyiceberg.io import PYARROW_USE_LARGE_TYPES_ON_READ, load_file_io
 from pyiceberg.io.pyarrow import (
     pyarrow_to_schema,
 )
@@ -822,7 +822,7 @@ def test_table_scan_override_with_small_types(catalog: Catalog) -> None:
     with tbl.update_schema() as update_schema:
         update_schema.update_column("string-to-binary", BinaryType())
 
-    tbl.io.properties[PYARROW_USE_LARGE_TYPES_ON_READ] = "False"
+    tbl.io = load_file_io({**tbl.io.properties, PYARROW_USE_LARGE_TYPES_ON_READ: "False"}, tbl.location())
     result_table = tbl.scan().to_arrow()
 
     expected_schema = pa.schema([
@@ -19,11 +19,14 @@ import os
 import pickle
 import tempfile
 import uuid
+from io import BufferedReader
+from typing import Any
 from unittest import mock
 
 import pytest
 from botocore.awsrequest import AWSRequest
 from fsspec.implementations.local import LocalFileSystem
+from fsspec.spec import AbstractBufferedFile
 from requests_mock import Mocker
 
 from pyiceberg.exceptions import SignError
@@ -54,6 +57,52 @@ def test_fsspec_local_fs_can_create_path_without_parent_dir(fsspec_fileio: Fsspe
             pytest.fail("Failed to write to file without parent directory")
 
 
+def test_fsspec_local_fs_read_ranges(fsspec_fileio: FsspecFileIO) -> None:
+    """Test reading several byte ranges of a file with LocalFileSystem"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_path = f"{tmpdirname}/foo.txt"
+        with fsspec_fileio.new_output(file_path).create() as f:
+            f.write(b"0123456789")
+
+        assert fsspec_fileio.new_input(file_path).read_ranges([6, 0], [4, 2]) == [b"6789", b"01"]
+
+
+def test_fsspec_local_fs_open_buffered(fsspec_fileio: FsspecFileIO) -> None:
+    """Test that a local file, which already buffers its reads, is not wrapped in another buffer"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_path = f"{tmpdirname}/foo.txt"
+        with fsspec_fileio.new_output(file_path).create() as f:
+            f.write(b"0123456789")
+
+        with fsspec_fileio.new_input(file_path).open_buffered(buffer_size=4) as f:
+            assert not isinstance(f, BufferedReader)
+            assert f.read() == b"0123456789"
+
+
+class BytesBufferedFile(AbstractBufferedFile):
+    """An AbstractBufferedFile over a bytes object, like the files of object store filesystems such as s3fs"""
+
+    def __init__(self, data: bytes, **kwargs: Any):
+        super().__init__(fs=mock.MagicMock(), path="bucket/foo.txt", size=len(data), **kwargs)
+        self.data = data
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        return self.data[start:end]
+
+
+def test_fsspec_open_buffered_keeps_abstract_buffered_file() -> None:
+    """Test that an AbstractBufferedFile, which reads ahead by its block size, is not wrapped in another buffer"""
+    buffered_file = BytesBufferedFile(b"0123456789", block_size=4)
+    fs = mock.MagicMock()
+    fs.open.return_value = buffered_file
+
+    with fsspec.FsspecInputFile(location="s3://bucket/foo.txt", fs=fs).open_buffered(buffer_size=4) as f:
+        assert f is buffered_file
+        assert f.read() == b"0123456789"
+
+    fs.open.assert_called_once_with("s3://bucket/foo.txt", "rb", block_size=4)
+
+
 @pytest.mark.s3
 def test_fsspec_new_input_file(fsspec_fileio: FsspecFileIO) -> None:
     """Test creating a new input file from a fsspec file-io"""
@@ -15,20 +15,36 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import io
 import os
 import pickle
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+from unittest.mock import patch
 
 import pytest
 
 from pyiceberg.io import (
     ARROW_FILE_IO,
+    IO_MAX_WORKERS_DEFAULT,
     PY_IO_IMPL,
-    _import_file_io,
-    _infer_file_io_from_scheme,
+    PYARROW,
+    SCHEMA_TO_FILE_IO,
+    InputFile,
+    InputStream,
+    _import_file_io_class,
+    _io_executor,
+    _io_max_workers,
+    _infer_file_io_class,
+    _infer_file_io_class_from_scheme,
+    _parse_location,
+    _resolve_file_io_class,
+    clear_file_io_cache,
     load_file_io,
 )
 from pyiceberg.io.pyarrow import PyArrowFileIO
+from pyiceberg.utils.concurrent import ExecutorFactory
 
 
 def test_custom_local_input_file() -> None:
@@ -52,6 +68,45 @@ def test_custom_local_input_file() -> None:
         assert len(input_file) == 3
 
 
+class RawInputFile(InputFile):
+    """An InputFile that returns unbuffered streams, and relies on the default implementations of the base class"""
+
+    def __len__(self) -> int:
+        return os.path.getsize(self.location)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.location)
+
+    def open(self, seekable: bool = True, read_ahead: Optional[int] = None) -> InputStream:
+        return io.FileIO(self.location, "rb")
+
+
+def test_open_buffered_wraps_raw_stream() -> None:
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as write_file:
+            write_file.write(b"foo")
+
+        with RawInputFile(file_location).open_buffered(buffer_size=2) as f:
+            assert isinstance(f, io.BufferedReader)
+            assert f.read() == b"foo"
+
+
+@pytest.mark.parametrize("input_file_factory", [RawInputFile, PyArrowFileIO().new_input])
+def test_read_ranges(input_file_factory: Callable[[str], InputFile]) -> None:
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as write_file:
+            write_file.write(b"0123456789")
+
+        input_file = input_file_factory(file_location)
+        assert input_file.read_ranges([6, 0, 2], [4, 2, 3]) == [b"6789", b"01", b"234"]
+
+        with pytest.raises(ValueError) as exc_info:
+            input_file.read_ranges([0, 1], [1])
+        assert "Expected as many offsets as lengths, got 2 and 1" in str(exc_info.value)
+
+
 def test_custom_local_output_file() -> None:
     """Test initializing an OutputFile implementation to write to a local file"""
     with tempfile.TemporaryDirectory() as tmpdirname:
@@ -273,18 +328,136 @@ def test_deleting_local_file_using_file_io_output_file() -> None:
         assert not os.path.exists(file_location)
 
 
+def test_io_max_workers() -> None:
+    with patch.dict(os.environ, {"PYICEBERG_IO_MAX_WORKERS": "5"}):
+        assert _io_max_workers() == 5
+
+    with patch.dict(os.environ, {"PYICEBERG_MAX_WORKERS": "1"}):
+        os.environ.pop("PYICEBERG_IO_MAX_WORKERS", None)
+        assert _io_max_workers() == IO_MAX_WORKERS_DEFAULT
+
+    with patch.dict(os.environ, {"PYICEBERG_IO_MAX_WORKERS": "invalid"}), pytest.raises(ValueError):
+        _io_max_workers()
+
+
+def test_io_executor_is_sized_from_config() -> None:
+    with patch.dict(os.environ, {"PYICEBERG_IO_MAX_WORKERS": "5"}), patch("pyiceberg.io._IO_EXECUTOR", None):
+        executor = _io_executor()
+        try:
+            assert isinstance(executor, ThreadPoolExecutor)
+            assert executor._max_workers == 5
+            assert _io_executor() is executor
+        finally:
+            executor.shutdown()
+
+
+def test_exists_and_delete_many() -> None:
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_locations = [os.path.join(tmpdirname, f"{name}.txt") for name in ("foo", "bar")]
+        for file_location in file_locations:
+            with open(file_location, "wb") as write_file:
+                write_file.write(b"foo")
+        missing_location = os.path.join(tmpdirname, "missing.txt")
+
+        file_io = PyArrowFileIO()
+        assert [input_file.location for input_file in file_io.new_inputs(file_locations)] == file_locations
+        assert file_io.exists_many([*file_locations, missing_location]) == [True, True, False]
+
+        file_io.delete_many(file_locations)
+        assert not any(os.path.exists(file_location) for file_location in file_locations)
+
+
+def test_exists_many_from_executor_factory_task() -> None:
+    # Bulk operations must not wait on the pool they may be called from
+    with ThreadPoolExecutor(max_workers=1) as executor, patch.object(ExecutorFactory, "_instance", executor):
+        future = executor.submit(PyArrowFileIO().exists_many, ["/does/not/exist"])
+        assert future.result(timeout=10) == [False]
+
+
+def test_read_ranges_from_executor_factory_task() -> None:
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as write_file:
+            write_file.write(b"0123456789")
+
+        input_file = PyArrowFileIO().new_input(file_location)
+        with ThreadPoolExecutor(max_workers=1) as executor, patch.object(ExecutorFactory, "_instance", executor):
+            future = executor.submit(input_file.read_ranges, [0, 5], [2, 2])
+            assert future.result(timeout=10) == [b"01", b"56"]
+
+
+def test_file_io_properties_are_frozen() -> None:
+    properties = {"warehouse": "s3://some-path/"}
+    file_io = PyArrowFileIO(properties)
+    properties["warehouse"] = "s3://other-path/"
+
+    assert file_io.properties == {"warehouse": "s3://some-path/"}
+    with pytest.raises(AttributeError):
+        file_io.properties["warehouse"] = "s3://other-path/"
+    with pytest.raises(AttributeError):
+        file_io.properties.pop("warehouse")
+    with pytest.raises(AttributeError):
+        file_io.properties.setdefault("s3.region", "us-east-1")
+    with pytest.raises(AttributeError):
+        file_io.properties |= {"s3.region": "us-east-1"}
+    assert file_io.properties == {"warehouse": "s3://some-path/"}
+
+    assert pickle.loads(pickle.dumps(file_io)).properties == {"warehouse": "s3://some-path/"}
+
+
 def test_import_file_io() -> None:
-    assert isinstance(_import_file_io(ARROW_FILE_IO, {}), PyArrowFileIO)
+    assert _import_file_io_class(ARROW_FILE_IO) is PyArrowFileIO
 
 
 def test_import_file_io_does_not_exist() -> None:
-    assert _import_file_io("pyiceberg.does.not.exist.FileIO", {}) is None
+    assert _import_file_io_class("pyiceberg.does.not.exist.FileIO") is None
+
+
+def test_resolve_file_io_class_is_cached() -> None:
+    _resolve_file_io_class.cache_clear()
+    assert _resolve_file_io_class(ARROW_FILE_IO) is PyArrowFileIO
+    assert _resolve_file_io_class(ARROW_FILE_IO) is PyArrowFileIO
+    assert _resolve_file_io_class.cache_info().hits == 1
 
 
 def test_load_file() -> None:
     assert isinstance(load_file_io({PY_IO_IMPL: ARROW_FILE_IO}), PyArrowFileIO)
 
 
+def test_load_file_io_is_cached() -> None:
+    assert load_file_io({"s3.region": "us-east-1"}, "s3://bucket/a") is load_file_io({"s3.region": "us-east-1"}, "s3://bucket/b")
+    assert load_file_io({"s3.region": "us-east-1"}) is not load_file_io({"s3.region": "us-west-2"})
+
+    # Unhashable values can't be cached, but still construct a FileIO
+    unhashable = {"s3.region": ["us-east-1"]}
+    assert load_file_io(unhashable) is not load_file_io(unhashable)
+
+
+def test_load_file_io_cached_properties_cannot_change() -> None:
+    properties = {"s3.region": "us-east-1"}
+    file_io = load_file_io(properties)
+
+    with pytest.raises(AttributeError):
+        file_io.properties.pop("s3.region")
+    with pytest.raises(AttributeError):
+        file_io.properties.setdefault("s3.endpoint", "http://localhost:9000")
+    with pytest.raises(AttributeError):
+        file_io.properties |= {"s3.endpoint": "http://localhost:9000"}
+
+    assert load_file_io(properties) is file_io
+    assert file_io.properties == properties
+
+
+def test_clear_file_io_cache() -> None:
+    file_io = load_file_io({"s3.region": "us-east-1"})
+    clear_file_io_cache()
+    assert load_file_io({"s3.region": "us-east-1"}) is not file_io
+
+
+def test_load_file_io_alias() -> None:
+    assert isinstance(load_file_io({PY_IO_IMPL: PYARROW}), PyArrowFileIO)
+
+
 def test_load_file_io_no_arguments() -> None:
     assert isinstance(load_file_io({}), PyArrowFileIO)
 
@@ -304,6 +477,10 @@ def test_load_file_io_location() -> None:
     assert isinstance(load_file_io({"location": "s3://some-path/"}), PyArrowFileIO)
 
 
+def test_load_file_io_gcs_location() -> None:
+    assert isinstance(load_file_io({}, "gcs://some-path/"), PyArrowFileIO)
+
+
 def test_load_file_io_location_no_schema() -> None:
     assert isinstance(load_file_io({"location": "/no-schema/"}), PyArrowFileIO)
 
@@ -329,7 +506,39 @@ def test_gibberish_table_location_file_io() -> None:
 
 def test_infer_file_io_from_schema_unknown() -> None:
     # When we have an unknown scheme, we would like to know
+    _infer_file_io_class.cache_clear()
     with pytest.warns(UserWarning) as w:
-        _infer_file_io_from_scheme("unknown://bucket/path/", {})
+        _infer_file_io_class_from_scheme("unknown://bucket/path/")
+        _infer_file_io_class_from_scheme("unknown://bucket/other-path/")
 
+    assert len(w) == 1
     assert str(w[0].message) == "No preferred file implementation for scheme: unknown"
+
+
+def test_infer_file_io_from_scheme_registered_after_lookup() -> None:
+    _infer_file_io_class.cache_clear()
+    with pytest.warns(UserWarning):
+        assert _infer_file_io_class_from_scheme("custom://bucket/path/") is None
+
+    with patch.dict(SCHEMA_TO_FILE_IO, {"custom": [ARROW_FILE_IO]}):
+        assert _infer_file_io_class_from_scheme("custom://bucket/path/") is PyArrowFileIO
+
+
+@pytest.mark.parametrize(
+    "location, expected",
+    [
+        ("s3://bucket/path/file.parquet", ("s3", "bucket", "bucket/path/file.parquet")),
+        ("S3://bucket/path", ("s3", "bucket", "bucket/path")),
+        ("s3://bucket", ("s3", "bucket", "bucket")),
+        ("s3://bucket/path?versionId=1", ("s3", "bucket", "bucket/path")),
+        ("s3://bucket/a\tb", ("s3", "bucket", "bucket/ab")),
+        ("hdfs://127.0.0.1:9000/root/foo.txt", ("hdfs", "127.0.0.1:9000", "/root/foo.txt")),
+        ("file:/root/foo.txt", ("file", "", "/root/foo.txt")),
+        ("/root/foo.txt", ("file", "", "/root/foo.txt")),
+        ("/root/tmp/../foo.txt", ("file", "", "/root/foo.txt")),
+        ("/root//tmp/", ("file", "", "/root/tmp")),
+        ("foo.txt", ("file", "", os.path.abspath("foo.txt"))),
+    ],
+)
+def test_parse_location(location: str, expected: Tuple[str, str, str]) -> None:
+    assert _parse_location(location) == expected
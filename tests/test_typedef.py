@@ -14,6 +14,9 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import pickle
+from typing import Any, Callable
+
 import pytest
 
 from pyiceberg.schema import Schema
@@ -38,6 +41,40 @@ def test_update_frozendict() -> None:
         d.update({"yes": 2})
 
 
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: d.__delitem__("foo"),
+        lambda d: d.pop("foo"),
+        lambda d: d.pop("missing", None),
+        lambda d: d.popitem(),
+        lambda d: d.clear(),
+        lambda d: d.setdefault("yes", 2),
+        lambda d: d.__ior__({"yes": 2}),
+    ],
+)
+def test_mutate_frozendict(mutate: Callable[[FrozenDict], Any]) -> None:
+    d = FrozenDict(foo=1, bar=2)
+    with pytest.raises(AttributeError):
+        mutate(d)
+    assert d == {"foo": 1, "bar": 2}
+
+
+def test_delitem_and_ior_frozendict() -> None:
+    d = FrozenDict(foo=1, bar=2)
+    with pytest.raises(AttributeError):
+        del d["foo"]
+    with pytest.raises(AttributeError):
+        d |= {"yes": 2}
+    assert d == {"foo": 1, "bar": 2}
+
+
+def test_pickle_frozendict() -> None:
+    d = FrozenDict(foo=1, bar=2)
+    assert pickle.loads(pickle.dumps(d)) == d
+    assert isinstance(pickle.loads(pickle.dumps(d)), FrozenDict)
+
+
 def test_keydefaultdict() -> None:
     def one(_: int) -> int:
         return 1